@@ -4,9 +4,11 @@ from enum import auto, Enum
 TYPE_FIELD = "data_type"
 VALUE_FIELD = "value"
 KEYS_FIELD = "keys"
+ITEM_TYPE_FIELD = "item_type"
 SCHEMA_FIELD = "_safestructures_schema_"
 VERSION_FIELD = "_safestructures_schema_version_"
-SCHEMA_VERSION = "1.0.0"
+ENCODER_FIELD = "_safestructures_schema_encoder_"
+SCHEMA_VERSION = "1.2.0"
 
 
 class Mode(Enum):
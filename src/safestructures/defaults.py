@@ -1,5 +1,8 @@
 """Defaults."""
 
+from typing import Optional, Type
+
+from safestructures.processors import tensor
 from safestructures.processors.base import DataProcessor
 from safestructures.processors.basic import (
     BoolProcessor,
@@ -17,7 +20,6 @@ from safestructures.processors.iterable import (
     TupleProcessor,
 )
 from safestructures.processors.tensor import NumpyProcessor
-from safestructures.utils.module import is_available
 
 basic_cls_list = [
     IntProcessor,
@@ -35,9 +37,7 @@ def register_processor(mapping: dict, processor: DataProcessor) -> dict:
     return mapping
 
 
-BASIC_PROCESS_MAP = {}
-for processor in basic_cls_list:
-    register_processor(BASIC_PROCESS_MAP, processor)
+BASIC_PROCESS_MAP = {processor.data_type: processor for processor in basic_cls_list}
 
 iterable_cls_list = [
     ListProcessor,
@@ -47,26 +47,42 @@ iterable_cls_list = [
     DataclassProcessor,
 ]
 
-ITERABLE_PROCESS_MAP = {}
-for processor in iterable_cls_list:
-    register_processor(ITERABLE_PROCESS_MAP, processor)
+ITERABLE_PROCESS_MAP = {
+    processor.data_type: processor for processor in iterable_cls_list
+}
+
+TENSOR_PROCESS_MAP = {NumpyProcessor.data_type: NumpyProcessor}
 
-DEFAULT_PROCESS_MAP = {**BASIC_PROCESS_MAP, **ITERABLE_PROCESS_MAP}
+DEFAULT_PROCESS_MAP = BASIC_PROCESS_MAP | ITERABLE_PROCESS_MAP | TENSOR_PROCESS_MAP
 
-register_processor(DEFAULT_PROCESS_MAP, NumpyProcessor)
 
+# Processors for ML framework tensors, keyed by the framework's top-level module.
+# These are only imported once a tensor of that framework is processed,
+# so that importing safestructures does not import the frameworks.
+LAZY_PROCESS_MAP = {
+    "torch": "TorchProcessor",
+    "tensorflow": "TFProcessor",
+    "jax": "JaxProcessor",
+    "jaxlib": "JaxProcessor",
+}
 
-if is_available("torch"):
-    from safestructures.processors.tensor import TorchProcessor
 
-    register_processor(DEFAULT_PROCESS_MAP, TorchProcessor)
+def get_lazy_processor(data_type: Type) -> Optional[DataProcessor]:
+    """Provide the ML framework processor for a data type, if there is one.
 
-if is_available("tensorflow"):
-    from safestructures.processors.tensor import TFProcessor
+    Args:
+        data_type (Type): The data type.
 
-    register_processor(DEFAULT_PROCESS_MAP, TFProcessor)
+    Returns:
+        Optional[DataProcessor]: The processor for the data type,
+            or None if no ML framework processor handles it.
+    """
+    name = LAZY_PROCESS_MAP.get(data_type.__module__.partition(".")[0])
+    if name is None:
+        return None
 
-if is_available("jax"):
-    from safestructures.processors.tensor import JaxProcessor
+    processor = getattr(tensor, name)
+    if processor.data_type is not data_type:
+        return None
 
-    register_processor(DEFAULT_PROCESS_MAP, JaxProcessor)
+    return processor
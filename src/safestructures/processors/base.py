@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Type, TYPE_CHECKING, Union
+from typing import Any, Optional, Type, TYPE_CHECKING, Union
 
 import numpy as np
 
-from safestructures.constants import Mode, TYPE_FIELD, VALUE_FIELD
+from safestructures.constants import ITEM_TYPE_FIELD, Mode, TYPE_FIELD, VALUE_FIELD
 from safestructures.utils.module import get_import_path
 
 if TYPE_CHECKING:
@@ -15,10 +15,18 @@ if TYPE_CHECKING:
 
 
 class DataProcessor(ABC):
-    """Base class for data processors other than tensors."""
+    """Base class for data processors other than tensors.
+
+    A serializer creates one instance per data type and reuses it,
+    so processors must not store per-value state.
+    """
 
     data_type: Type[Any] = Any
 
+    # Cached per class by `DataProcessor.schema_type`, along with the data type
+    # it was computed from, in case `data_type` is assigned later.
+    _schema_type_cache: Optional[tuple[Any, str]] = None
+
     def __init__(self, serializer: Serializer):
         """Initialize the DataProcessor.
 
@@ -35,7 +43,14 @@ class DataProcessor(ABC):
         Returns:
             str: The import path of the data type.
         """
-        return get_import_path(self.data_type)
+        data_type = self.data_type
+        cache = self._schema_type_cache
+        if cache is not None and cache[0] is data_type:
+            return cache[1]
+
+        schema_type = get_import_path(data_type)
+        type(self)._schema_type_cache = (data_type, schema_type)
+        return schema_type
 
     @abstractmethod
     def serialize(self, data: Any) -> Union[str, None, bool, list, dict]:
@@ -85,6 +100,43 @@ class DataProcessor(ABC):
         """
         pass
 
+    def _has_serialize_extra(self) -> bool:
+        """Check whether the class overrides `DataProcessor.serialize_extra`.
+
+        The default adds nothing, so calling it can be skipped. This is checked
+        per call, so a `serialize_extra` assigned to the class later is used.
+
+        Returns:
+            bool: True if `serialize_extra` must be called.
+        """
+        return type(self).serialize_extra is not DataProcessor.serialize_extra
+
+    def _check_extra(self, extra: dict):
+        """Verify the extra schema provided by `DataProcessor.serialize_extra`.
+
+        Args:
+            extra (dict): The extra schema.
+        """
+        if not isinstance(extra, dict):
+            raise TypeError(f"{type(self)}.serialize_extra must return a dictionary.")
+        if TYPE_FIELD in extra:
+            raise KeyError(
+                f"{type(self)}.serialize_extra must not have a {TYPE_FIELD} key."
+            )
+        if VALUE_FIELD in extra:
+            raise KeyError(
+                f"{type(self)}.serialize_extra must not have a {VALUE_FIELD} key."
+            )
+
+        for k in extra.keys():
+            if not isinstance(k, str):
+                raise TypeError(
+                    (
+                        f"Dictionary returned by {type(self)}.serialize_extra"
+                        " must have string keys only."
+                    )
+                )
+
     def __call__(self, data_or_schema: Any) -> Any:
         """Process the data or schema.
 
@@ -100,30 +152,10 @@ class DataProcessor(ABC):
             schema = {TYPE_FIELD: self.schema_type}
 
             schema[VALUE_FIELD] = self.serialize(data_or_schema)
-            extra = self.serialize_extra(data_or_schema)
-
-            if not isinstance(extra, dict):
-                raise TypeError(
-                    f"{type(self)}.serialize_extra must return a dictionary."
-                )
-            if TYPE_FIELD in extra:
-                raise KeyError(
-                    f"{type(self)}.serialize_extra must not have a {TYPE_FIELD} key."
-                )
-            if VALUE_FIELD in extra:
-                raise KeyError(
-                    f"{type(self)}.serialize_extra must not have a {VALUE_FIELD} key."
-                )
-
-            for k in extra.keys():
-                if not isinstance(k, str):
-                    raise TypeError(
-                        (
-                            f"Dictionary returned by {type(self)}.serialize_extra"
-                            " must have string keys only."
-                        )
-                    )
-            schema.update(extra)
+            if self._has_serialize_extra():
+                extra = self.serialize_extra(data_or_schema)
+                self._check_extra(extra)
+                schema.update(extra)
 
             return schema
 
@@ -139,28 +171,133 @@ class DataProcessor(ABC):
 
 
 class ListBaseProcessor(DataProcessor):
-    """Base class to process list-like data."""
+    """Base class to process list-like data.
 
-    def serialize(self, data: Union[list, set, tuple]) -> dict:
-        """Overload `DataProcessor.serialize`."""
-        data_list = []
-        for d in data:
-            data_list.append(self.serializer.serialize(d))
+    If all items are of the same basic data type, only their serialized values
+    are stored, along with the item type as ITEM_TYPE_FIELD, instead of a schema
+    per item. This is only done if neither `serialize` nor `deserialize` is
+    overridden, so subclasses always see a schema per item.
+    """
+
+    # Basic data types for items that do not need their own schema.
+    item_types: dict[str, Type] = {
+        get_import_path(t): t for t in (int, float, complex, str, bool, type(None))
+    }
+
+    def _get_item_type(self, data: Union[list, set, tuple]) -> Optional[Type]:
+        """Provide the basic data type shared by all items, if there is one.
+
+        Args:
+            data (Union[list, set, tuple]): The list-like data.
+
+        Returns:
+            Optional[Type]: The item data type, or None if the items are
+                empty, of mixed types, or not of a basic data type.
+        """
+        if not data:
+            return None
 
-        return data_list
+        item_type = type(next(iter(data)))
+        if item_type not in self.item_types.values():
+            return None
+        if not all(type(d) is item_type for d in data):
+            return None
+
+        return item_type
+
+    def _serialize_items(
+        self, data: Union[list, set, tuple], item_type: Optional[Type]
+    ) -> list:
+        """Serialize the items, storing only their values if they share a type.
+
+        Args:
+            data (Union[list, set, tuple]): The list-like data.
+            item_type (Optional[Type]): The basic data type shared by all items,
+                as given by `ListBaseProcessor._get_item_type`.
+
+        Returns:
+            list: The serialized items.
+        """
+        if item_type is not None:
+            serialize = self.serializer.get_processor(item_type).serialize
+        else:
+            serialize = self.serializer.serialize
+        return [serialize(d) for d in data]
+
+    def serialize(self, data: Union[list, set, tuple]) -> list:
+        """Overload `DataProcessor.serialize`.
+
+        Each item is serialized with its own schema.
+        """
+        return self._serialize_items(data, None)
+
+    def __call__(self, data_or_schema: Any) -> Any:
+        """Overload `DataProcessor.__call__`.
+
+        The item type is found once per value and used for both the serialized
+        items and ITEM_TYPE_FIELD, so compact values and ITEM_TYPE_FIELD are
+        always written together. Subclasses that override `serialize` or
+        `deserialize` may expect a schema per item, so they are not compacted.
+        """
+        if self.serializer.mode != Mode.SAVE:
+            return super().__call__(data_or_schema)
+        cls = type(self)
+        if cls.serialize is not ListBaseProcessor.serialize:
+            return super().__call__(data_or_schema)
+        if cls.deserialize is not ListBaseProcessor.deserialize:
+            return super().__call__(data_or_schema)
+
+        item_type = self._get_item_type(data_or_schema)
+        schema = {
+            TYPE_FIELD: self.schema_type,
+            VALUE_FIELD: self._serialize_items(data_or_schema, item_type),
+        }
+        if item_type is not None:
+            schema[ITEM_TYPE_FIELD] = self.serializer.get_processor(
+                item_type
+            ).schema_type
+        if self._has_serialize_extra():
+            extra = self.serialize_extra(data_or_schema)
+            self._check_extra(extra)
+            schema.update(extra)
+
+        return schema
 
     def deserialize(self, serialized: list, **kwargs) -> list:
         """Overload `DataProcessor.deserialize`."""
-        results = []
-        for v in serialized:
-            results.append(self.serializer.deserialize(v))
+        item_type = kwargs.get(ITEM_TYPE_FIELD)
+        if item_type is not None:
+            item_type = self.item_types[item_type]
+            deserialize = self.serializer.get_processor(item_type).deserialize
+        else:
+            deserialize = self.serializer.deserialize
+        return self.data_type([deserialize(v) for v in serialized])
 
-        return self.data_type(results)
+
+# Float types that NumPy, and therefore safetensors.numpy, supports natively.
+NUMPY_FLOAT_TYPES = (np.float16, np.float32, np.float64)
+# Float type that other float tensors, such as BF16, are cast to.
+FLOAT_CAST_TYPE = np.float32
 
 
 class TensorProcessor(DataProcessor, ABC):
     """Base class to process tensors."""
 
+    def float_cast_type(self, dtype: Optional[np.dtype]) -> Optional[Type]:
+        """Provide the type to cast a float tensor to before converting to NumPy.
+
+        Args:
+            dtype (Optional[np.dtype]): The NumPy equivalent of the float tensor's
+                data type, or None if there is none.
+
+        Returns:
+            Optional[Type]: The NumPy float type to cast to,
+                or None if the tensor can be kept as is.
+        """
+        if dtype is not None and dtype in NUMPY_FLOAT_TYPES:
+            return None
+        return FLOAT_CAST_TYPE
+
     @abstractmethod
     def to_numpy(self, tensor: Any) -> np.ndarray:
         """Convert tensor to Numpy array.
@@ -169,7 +306,8 @@ class TensorProcessor(DataProcessor, ABC):
             tensor (Any): The tensor to convert to Numpy.
 
         Returns:
-            np.ndarray: The tensor as a Numpy array.
+            np.ndarray: The tensor as a Numpy array. This may be non-contiguous,
+                since `TensorProcessor.process_tensor` makes it contiguous.
         """
         pass
 
@@ -183,14 +321,27 @@ class TensorProcessor(DataProcessor, ABC):
             str: The tensor ID.
         """
         assert isinstance(tensor, np.ndarray), "Tensor must be np.ndarry at this point."
+        # safetensors writes the raw buffer, so views such as transposes
+        # must be made contiguous. This only copies when needed.
+        if not tensor.flags.c_contiguous:
+            tensor = np.ascontiguousarray(tensor)
         _id = str(len(self.serializer.tensors))
         self.serializer.tensors[_id] = tensor
         return _id
 
     def serialize(self, tensor: Any) -> dict:
-        """Overload `DataProcessor.serialize`."""
-        tensor = self.to_numpy(tensor)
-        return self.process_tensor(tensor)
+        """Overload `DataProcessor.serialize`.
+
+        A tensor object referenced multiple times is only stored once.
+        """
+        memo = self.serializer.tensor_memo
+        memo_key = id(tensor)
+        if memo_key in memo:
+            return memo[memo_key][1]
+
+        _id = self.process_tensor(self.to_numpy(tensor))
+        memo[memo_key] = (tensor, _id)
+        return _id
 
     def deserialize(self, tensor_id: str, **kwargs) -> Any:
         """Overload `DataProcessor.deserialize`."""
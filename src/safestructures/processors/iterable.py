@@ -2,9 +2,16 @@
 
 import dataclasses
 
-from safestructures.constants import KEYS_FIELD
+from safestructures.constants import KEYS_FIELD, TYPE_FIELD
 from safestructures.processors.base import DataProcessor, ListBaseProcessor
 from safestructures.utils.dataclass import SafestructuresDataclass
+from safestructures.utils.module import get_import_path
+
+# Field names by dataclass type, and generated dataclasses by field names.
+_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
+_DATACLASS_CACHE: dict[tuple[str, ...], type] = {}
+# Schema type of string keys, which `DictProcessor.serialize_extra` stores as-is.
+_STR_SCHEMA_TYPE = get_import_path(str)
 
 
 class ListProcessor(ListBaseProcessor):
@@ -32,34 +39,32 @@ class DictProcessor(DataProcessor):
 
     def serialize(self, data: dict) -> dict:
         """Overload `DataProcessor.serialize`."""
-        results = {}
-        for k, v in data.items():
-            key = str(k)
-            results[key] = self.serializer.serialize(v)
-
-        return results
+        serialize = self.serializer.serialize
+        return {str(k): serialize(v) for k, v in data.items()}
 
     def serialize_extra(self, data: dict) -> dict:
         """Overload `DataProcessor.serialize_extra`.
 
         The additional schema to provide helps serialize
         the dictionary keys themselves.
+        String keys need no schema, so it is omitted if all keys are strings.
         """
         # Keys can be numerical or tuple, not just strings.
-        schema = {KEYS_FIELD: {}}
-        for k in data:
-            key = str(k)
-            schema[KEYS_FIELD][key] = self.serializer.serialize(k)
-        return schema
+        serialize = self.serializer.serialize
+        key_schemas = {str(k): serialize(k) for k in data if type(k) is not str}
+        return {KEYS_FIELD: key_schemas} if key_schemas else {}
 
     def deserialize(self, serialized: dict, **kwargs) -> dict:
         """Overload `DataProcessor.deserialize`."""
+        deserialize = self.serializer.deserialize
+        key_schemas = kwargs.get(KEYS_FIELD, {})
         results = {}
-        key_schemas = kwargs[KEYS_FIELD]
         for k, v in serialized.items():
-            key_schema = key_schemas[k]
-            key = self.serializer.deserialize(key_schema)
-            results[key] = self.serializer.deserialize(v)
+            key_schema = key_schemas.get(k)
+            # String keys are already stored as-is.
+            if key_schema is not None and key_schema[TYPE_FIELD] != _STR_SCHEMA_TYPE:
+                k = deserialize(key_schema)
+            results[k] = deserialize(v)
 
         return results
 
@@ -71,20 +76,22 @@ class DataclassProcessor(DataProcessor):
 
     def serialize(self, data: SafestructuresDataclass) -> dict:
         """Overload `DataProcessor.serialize`."""
-        fields = dataclasses.fields(data)
-        results = {}
-        for f in fields:
-            name = f.name
-            results[name] = self.serializer.serialize(getattr(data, name))
+        data_type = type(data)
+        names = _FIELDS_CACHE.get(data_type)
+        if names is None:
+            names = tuple(f.name for f in dataclasses.fields(data))
+            _FIELDS_CACHE[data_type] = names
 
-        return results
+        serialize = self.serializer.serialize
+        return {name: serialize(getattr(data, name)) for name in names}
 
     def deserialize(self, serialized: dict, **kwargs) -> SafestructuresDataclass:
         """Overload `DataProcessor.deserialize`."""
-        fields = list(serialized.keys())
-        cls = dataclasses.make_dataclass(self.data_type.__name__, fields)
-        dc_kwargs = {}
-        for k, v in serialized.items():
-            dc_kwargs[k] = self.serializer.deserialize(v)
-
-        return cls(**dc_kwargs)
+        fields = tuple(serialized)
+        cls = _DATACLASS_CACHE.get(fields)
+        if cls is None:
+            cls = dataclasses.make_dataclass(self.data_type.__name__, fields)
+            _DATACLASS_CACHE[fields] = cls
+
+        deserialize = self.serializer.deserialize
+        return cls(**{k: deserialize(v) for k, v in serialized.items()})
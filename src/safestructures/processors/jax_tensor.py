@@ -0,0 +1,29 @@
+"""Plugin to process JAX arrays."""
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from jaxlib.xla_extension import ArrayImpl
+
+from safestructures.processors.base import TensorProcessor
+
+cpus = jax.devices("cpu")
+cpu_device = cpus[0]
+
+
+class JaxProcessor(TensorProcessor):
+    """JAX array processor."""
+
+    data_type = ArrayImpl
+
+    def to_numpy(self, tensor: ArrayImpl) -> np.ndarray:
+        """Overload `TensorProcessor.to_numpy`."""
+        # JAX float types, such as BF16, are already NumPy data types.
+        if jnp.issubdtype(tensor.dtype, jnp.floating):
+            cast_type = self.float_cast_type(tensor.dtype)
+            if cast_type is not None:
+                tensor = tensor.astype(cast_type)
+
+        # JAX arrays are immutable, so the NumPy array can share their memory.
+        # Arrays on other devices are transferred to the host.
+        return np.asarray(tensor)
@@ -3,7 +3,15 @@
 import numpy as np
 
 from safestructures.processors.base import TensorProcessor
-from safestructures.utils.module import is_available
+from safestructures.utils.module import load_module
+
+# The ML framework processors live in their own submodules
+# so that they, and the framework, are only imported when needed.
+FRAMEWORK_PROCESSORS = {
+    "TorchProcessor": "safestructures.processors.torch_tensor",
+    "TFProcessor": "safestructures.processors.tf_tensor",
+    "JaxProcessor": "safestructures.processors.jax_tensor",
+}
 
 
 class NumpyProcessor(TensorProcessor):
@@ -16,60 +24,9 @@ class NumpyProcessor(TensorProcessor):
         return tensor
 
 
-if is_available("torch"):
-    import torch
-
-    class TorchProcessor(TensorProcessor):
-        """PyTorch tensor processor."""
-
-        data_type = torch.Tensor
-
-        def to_numpy(self, tensor: torch.Tensor) -> np.ndarray:
-            """Overload `TensorProcessor.to_numpy`."""
-            tensor = tensor.detach().contiguous()
-            if torch.is_floating_point(tensor):
-                tensor = tensor.float()
-
-            return tensor.numpy()
-
-
-if is_available("tensorflow"):
-    import tensorflow as tf
-    from tensorflow.python.framework.ops import EagerTensor
-
-    class TFProcessor(TensorProcessor):
-        """TensorFlow tensor processor."""
-
-        data_type = EagerTensor
-
-        def to_numpy(self, tensor: EagerTensor) -> np.ndarray:
-            """Overload `TensorProcessor.to_numpy`."""
-            dtype = tensor.dtype
-            if dtype.is_floating:
-                dtype = tf.float32
-                tensor = tf.cast(tensor, dtype=dtype)
-
-            return tensor.numpy()
-
-
-if is_available("jax"):
-    import jax
-    import jax.numpy as jnp
-    from jaxlib.xla_extension import ArrayImpl
-
-    cpus = jax.devices("cpu")
-    cpu_device = cpus[0]
-
-    class JaxProcessor(TensorProcessor):
-        """JAX array processor."""
-
-        data_type = ArrayImpl
+def __getattr__(name: str):
+    """Lazily provide the ML framework processors."""
+    if name in FRAMEWORK_PROCESSORS:
+        return getattr(load_module(FRAMEWORK_PROCESSORS[name]), name)
 
-        def to_numpy(self, tensor: ArrayImpl) -> np.ndarray:
-            """Overload `TensorProcessor.to_numpy`."""
-            tensor = jnp.copy(tensor)
-            dtype = tensor.dtype
-            if jnp.issubdtype(tensor.dtype, jnp.floating):
-                dtype = jnp.float32
-                tensor = tensor.astype(dtype)
-            return np.asarray(tensor)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,23 @@
+"""Plugin to process TensorFlow tensors."""
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.python.framework.ops import EagerTensor
+
+from safestructures.processors.base import TensorProcessor
+
+
+class TFProcessor(TensorProcessor):
+    """TensorFlow tensor processor."""
+
+    data_type = EagerTensor
+
+    def to_numpy(self, tensor: EagerTensor) -> np.ndarray:
+        """Overload `TensorProcessor.to_numpy`."""
+        dtype = tensor.dtype
+        if dtype.is_floating:
+            cast_type = self.float_cast_type(np.dtype(dtype.as_numpy_dtype))
+            if cast_type is not None:
+                tensor = tf.cast(tensor, dtype=cast_type)
+
+        return tensor.numpy()
@@ -0,0 +1,32 @@
+"""Plugin to process PyTorch tensors."""
+
+import numpy as np
+import torch
+
+from safestructures.processors.base import TensorProcessor
+
+# NumPy equivalents of PyTorch float types. Others, such as BF16, have none.
+NUMPY_DTYPES = {
+    torch.float16: np.float16,
+    torch.float32: np.float32,
+    torch.float64: np.float64,
+}
+TORCH_DTYPES = {v: k for k, v in NUMPY_DTYPES.items()}
+
+
+class TorchProcessor(TensorProcessor):
+    """PyTorch tensor processor."""
+
+    data_type = torch.Tensor
+
+    def to_numpy(self, tensor: torch.Tensor) -> np.ndarray:
+        """Overload `TensorProcessor.to_numpy`."""
+        # Both are no-ops for CPU tensors that do not require grad.
+        # Non-contiguous tensors are made contiguous by `process_tensor`.
+        tensor = tensor.detach().cpu()
+        if torch.is_floating_point(tensor):
+            cast_type = self.float_cast_type(NUMPY_DTYPES.get(tensor.dtype))
+            if cast_type is not None:
+                tensor = tensor.to(TORCH_DTYPES[cast_type])
+
+        return tensor.numpy()
@@ -3,8 +3,8 @@
 import builtins
 import importlib
 import json
+import math
 import types
-from copy import deepcopy
 from dataclasses import is_dataclass
 from pathlib import Path, PosixPath
 from typing import Any, Optional, Type, Union
@@ -14,15 +14,99 @@ from safetensors import safe_open
 from safetensors.numpy import save_file
 
 from safestructures.constants import (
+    ENCODER_FIELD,
     Mode,
     SCHEMA_FIELD,
     SCHEMA_VERSION,
     TYPE_FIELD,
     VERSION_FIELD,
 )
-from safestructures.defaults import DEFAULT_PROCESS_MAP, register_processor
+from safestructures.defaults import (
+    DEFAULT_PROCESS_MAP,
+    get_lazy_processor,
+    register_processor,
+)
 from safestructures.processors.base import DataProcessor
 from safestructures.processors.iterable import SafestructuresDataclass
+from safestructures.utils.module import is_available
+
+if is_available("orjson"):
+    import orjson
+else:
+    orjson = None
+
+# Resolved data types from schema type strings, prepopulated with common types.
+_DATA_TYPE_CACHE: dict[str, Type] = {
+    "None": types.NoneType,
+    "NoneType": types.NoneType,
+    SafestructuresDataclass.__name__: SafestructuresDataclass,
+    **{t.__name__: t for t in (int, float, complex, str, bool, list, tuple, set, dict)},
+}
+
+
+def _dump_schema(schema: dict) -> tuple[str, str]:
+    """Dump the schema to a JSON string, using `orjson` if available.
+
+    Args:
+        schema (dict): The schema.
+
+    Returns:
+        tuple[str, str]: The schema as a JSON string,
+            and the name of the encoder that wrote it.
+    """
+    if orjson is not None:
+        try:
+            schema_bytes = orjson.dumps(schema)
+        except TypeError:
+            # orjson is stricter than json, e.g. for non-string keys
+            # or integers wider than 64 bits.
+            pass
+        else:
+            # orjson writes NaN and infinities as null, unlike json.
+            # Only schemas with a null can be affected, so only those are checked.
+            if b"null" not in schema_bytes or not _has_non_finite(schema):
+                return schema_bytes.decode(), "orjson"
+    return json.dumps(schema), "json"
+
+
+def _has_non_finite(schema: Any) -> bool:
+    """Check whether the schema contains NaN or infinite floats.
+
+    Args:
+        schema (Any): The schema, or any of its nested values.
+
+    Returns:
+        bool: True if a non-finite float is found.
+    """
+    stack = [schema]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _load_schema(schema_str: str, encoder: Optional[str] = None) -> dict:
+    """Load the schema from a JSON string, using `orjson` if it wrote the schema.
+
+    Args:
+        schema_str (str): The schema as a JSON string.
+        encoder (Optional[str]): The name of the encoder that wrote the schema,
+            as given by `_dump_schema`. Defaults to None if it is not known.
+
+    Returns:
+        dict: The schema.
+    """
+    # orjson reads integers wider than 64 bits as floats, and does not read
+    # NaN and infinities, so only schemas it wrote are safe for it to read.
+    if orjson is not None and encoder == "orjson":
+        return orjson.loads(schema_str)
+    return json.loads(schema_str)
 
 
 class Serializer:
@@ -31,8 +115,11 @@ class Serializer:
     def __init__(self, plugins: Optional[list[DataProcessor]] = None):
         """Initialize the serializer."""
         self.tensors = {}
+        # Tensor IDs by the id() of the saved tensor objects, along with the objects
+        # themselves so their id() cannot be reused while saving.
+        self.tensor_memo: dict[int, tuple[Any, str]] = {}
 
-        self.process_map: dict[type, DataProcessor] = deepcopy(DEFAULT_PROCESS_MAP)
+        self.process_map: dict[type, DataProcessor] = dict(DEFAULT_PROCESS_MAP)
 
         if plugins:
             for p in plugins:
@@ -41,8 +128,21 @@ class Serializer:
 
         self.mode: Optional[Mode] = None
 
+        # Processor instances, by processed data type and by schema type string.
+        # These avoid resolving and instantiating processors per node.
+        self._processors: dict[type, DataProcessor] = {}
+        self._schema_processors: dict[str, DataProcessor] = {}
+
     @staticmethod
     def _get_data_type(type_str: str) -> Type:
+        data_type = _DATA_TYPE_CACHE.get(type_str)
+        if data_type is None:
+            data_type = Serializer._resolve_data_type(type_str)
+            _DATA_TYPE_CACHE[type_str] = data_type
+        return data_type
+
+    @staticmethod
+    def _resolve_data_type(type_str: str) -> Type:
         # Handle "None" or "NoneType"
         if type_str in {"None", "NoneType"}:
             return types.NoneType
@@ -62,6 +162,16 @@ class Serializer:
         except (ValueError, ImportError, AttributeError) as e:
             raise ImportError(f"Cannot import type: {type_str}") from e
 
+    def _register_lazy_processor(self, data_type: Type):
+        """Register the ML framework processor for the data type, if there is one.
+
+        Args:
+            data_type (Type): The data type without a registered processor.
+        """
+        processor = get_lazy_processor(data_type)
+        if processor is not None:
+            register_processor(self.process_map, processor)
+
     def _check_plugin(self, plugin: DataProcessor):
         """Verify the external plugin.
 
@@ -74,13 +184,39 @@ class Serializer:
         )
         assert issubclass(plugin, DataProcessor), error_msg
 
-        if plugin.data_type in self.process_map:
+        lazy_processor = get_lazy_processor(plugin.data_type)
+        if plugin.data_type in self.process_map or lazy_processor is not None:
             error_msg = (
                 f"Processor for {plugin.data_type} already exists."
                 "Processors must be unique."
             )
             raise ValueError(error_msg)
 
+    def get_processor(self, data_type: Type) -> DataProcessor:
+        """Provide the processor instance for a data type.
+
+        Processor instances are created once per data type and then reused.
+
+        Args:
+            data_type (Type): The data type.
+
+        Returns:
+            DataProcessor: The processor instance.
+        """
+        processor = self._processors.get(data_type)
+        if processor is None:
+            try:
+                processor_cls = self.process_map[data_type]
+            except KeyError:
+                raise TypeError(
+                    f"Processor for type {data_type} not found."
+                    " Please create a plugin and use the plugins kwarg"
+                    " for the Serializer."
+                )
+            processor = processor_cls(self)
+            self._processors[data_type] = processor
+        return processor
+
     def serialize(self, data: Any) -> dict:
         """Serialize the data so that it can be stored in a safetensors file.
 
@@ -91,16 +227,19 @@ class Serializer:
             dict: The schema showing the datatypes and serialized values.
         """
         data_type = type(data)
-        if data_type not in self.process_map and is_dataclass(data):
-            data_type = SafestructuresDataclass
-
-        try:
-            return self.process_map[data_type](self)(data)
-        except KeyError:
-            raise TypeError(
-                f"Processor for type {data_type} not found."
-                " Please create a plugin and use the plugins kwarg for the Serializer."
-            )
+        processor = self._processors.get(data_type)
+        if processor is None:
+            if data_type not in self.process_map:
+                # Dataclass instances, but not dataclass types themselves.
+                if is_dataclass(data) and not isinstance(data, type):
+                    processor = self.get_processor(SafestructuresDataclass)
+                else:
+                    self._register_lazy_processor(data_type)
+            if processor is None:
+                processor = self.get_processor(data_type)
+            self._processors[data_type] = processor
+
+        return processor(data)
 
     def deserialize(self, schema: dict) -> Any:
         """Deserialize the schema, providing the reconstructed data.
@@ -113,15 +252,15 @@ class Serializer:
         """
         data_type_str = schema[TYPE_FIELD]
 
-        data_type = self._get_data_type(data_type_str)
+        processor = self._schema_processors.get(data_type_str)
+        if processor is None:
+            data_type = self._get_data_type(data_type_str)
+            if data_type not in self.process_map:
+                self._register_lazy_processor(data_type)
+            processor = self.get_processor(data_type)
+            self._schema_processors[data_type_str] = processor
 
-        try:
-            return self.process_map[data_type](self)(schema)
-        except KeyError:
-            raise TypeError(
-                f"Processor for type {data_type} not found."
-                " Please create a plugin and use the plugins kwarg for the Serializer."
-            )
+        return processor(schema)
 
     def save(
         self,
@@ -139,12 +278,18 @@ class Serializer:
         """
         save_path = Path(save_path).expanduser().resolve()
         self.tensors.clear()
+        self.tensor_memo.clear()
         self.mode = Mode.SAVE
         schema = self.serialize(data)
         if not metadata:
             metadata = {}
+        schema_str, encoder = _dump_schema(schema)
         metadata.update(
-            {SCHEMA_FIELD: json.dumps(schema), VERSION_FIELD: SCHEMA_VERSION}
+            {
+                SCHEMA_FIELD: schema_str,
+                VERSION_FIELD: SCHEMA_VERSION,
+                ENCODER_FIELD: encoder,
+            }
         )
 
         if not self.tensors:
@@ -152,7 +297,12 @@ class Serializer:
             # Safetensors requires at least 1 tensor to save.
             self.tensors["null"] = np.array([0])
 
-        save_file(self.tensors, save_path, metadata=metadata)
+        try:
+            save_file(self.tensors, save_path, metadata=metadata)
+        finally:
+            # Do not keep the saved tensors alive through the serializer.
+            self.tensors.clear()
+            self.tensor_memo.clear()
         return
 
     def load(
@@ -182,7 +332,9 @@ class Serializer:
             metadata = f.metadata()
 
         try:
-            schema = json.loads(metadata[SCHEMA_FIELD])
+            schema = _load_schema(
+                metadata[SCHEMA_FIELD], encoder=metadata.get(ENCODER_FIELD)
+            )
         except KeyError:
             raise ValueError(
                 f"File {load_path} is not a valid safetensors file"
@@ -1,11 +1,11 @@
 """Dataclass utilities."""
-import dataclasses
-from typing import Protocol, runtime_checkable
 
 
-@runtime_checkable
-@dataclasses.dataclass
-class SafestructuresDataclass(Protocol):
-    """Protocol to help provide a 'dataclass' type."""
+class SafestructuresDataclass:
+    """Sentinel type to help provide a 'dataclass' type.
+
+    Dataclass instances are detected with `dataclasses.is_dataclass`,
+    so this class is only used to look up the dataclass processor.
+    """
 
     pass
@@ -1,5 +1,7 @@
 """Import utilities."""
 import importlib
+import importlib.util
+from functools import lru_cache
 from types import ModuleType
 from typing import Type
 
@@ -18,6 +20,7 @@ def load_module(module_name: str) -> ModuleType:
     return importlib.import_module(module_name, package=None)
 
 
+@lru_cache(maxsize=None)
 def is_available(module_name: str) -> bool:
     """Check if a Python module is available.
 
@@ -27,7 +30,7 @@ def is_available(module_name: str) -> bool:
     Returns:
         bool: True if available, False if not.
     """
-    return importlib.util.find_spec(module_name)
+    return importlib.util.find_spec(module_name) is not None
 
 
 def get_import_path(data_type: Type):
@@ -1,8 +1,58 @@
 """Pytest configuration."""
 
-import tensorflow as tf
+from unittest import mock
 
-gpus = tf.config.list_physical_devices("GPU")
-if gpus:
-    for gpu in gpus:
-        tf.config.experimental.set_memory_growth(gpu, True)
+import pytest
+
+from safestructures.utils.module import is_available
+
+if is_available("tensorflow"):
+    import tensorflow as tf
+
+    gpus = tf.config.list_physical_devices("GPU")
+    if gpus:
+        for gpu in gpus:
+            tf.config.experimental.set_memory_growth(gpu, True)
+
+
+def pytest_addoption(parser):
+    """Add command line options."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="Run slow tests."
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line("markers", "slow: mark test as slow to run")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless `--run-slow` is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="Needs --run-slow to run.")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+class StubSerializer:
+    """Lightweight stand-in for `Serializer` with mocked (de)serialization."""
+
+    def __init__(self):
+        """Initialize the stub."""
+        self.serialize = mock.Mock()
+        self.deserialize = mock.Mock()
+
+
+@pytest.fixture
+def mock_serializer():
+    """Provide stub Serializer fixture."""
+    return StubSerializer()
+
+
+@pytest.fixture
+def mock_deserializer():
+    """Provide stub Serializer fixture for deserialization."""
+    return StubSerializer()
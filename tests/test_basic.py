@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+from safestructures.constants import Mode, TYPE_FIELD, VALUE_FIELD
 from safestructures.processors.basic import (
     BoolProcessor,
     ComplexProcessor,
@@ -12,102 +13,79 @@ from safestructures.processors.basic import (
     StringProcessor,
 )
 
-numeric_test_cases = [
-    (IntProcessor, 42),
-    (IntProcessor, -42),
-    (FloatProcessor, 1.61803398874989),
-    (FloatProcessor, -1.61803398874989),
-    (ComplexProcessor, complex(1, 2)),
+# Processor, value, and its expected serialized value.
+basic_test_cases = [
+    (StringProcessor, "mock_input", "mock_input"),
+    (IntProcessor, 42, "42"),
+    (IntProcessor, -42, "-42"),
+    (FloatProcessor, 1.61803398874989, "1.61803398874989"),
+    (FloatProcessor, -1.61803398874989, "-1.61803398874989"),
+    (ComplexProcessor, complex(1, 2), "(1+2j)"),
+    (BoolProcessor, True, True),
+    (BoolProcessor, False, False),
+    (NoneProcessor, None, None),
 ]
 
 
-@pytest.fixture
-def mock_serializer():
-    """Provide mocked Serializer fixture."""
-    return mock.MagicMock()
-
-
-def test_serialize_str(mock_serializer):
-    """Test string serialization to schema."""
-    test_input = "mock_input"
-    expected_value = test_input
-    result = StringProcessor(mock_serializer).serialize(test_input)
-
-    assert result == expected_value
+@pytest.fixture(autouse=True)
+def no_recursive_calls(mock_serializer):
+    """Check basic processors never recurse into the serializer."""
+    yield
     mock_serializer.serialize.assert_not_called()
     mock_serializer.deserialize.assert_not_called()
 
 
-def test_deserialize_str(mock_serializer):
-    """Test deserialization to string."""
-    test_value = "mock_input"
-    result = StringProcessor(mock_serializer).deserialize(test_value)
-
-    assert result == test_value
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
-
-
-@pytest.mark.parametrize("cls,test_input", numeric_test_cases)
-def test_serialize_numeric(mock_serializer, cls, test_input):
-    """Test numeric serialization to schema."""
-    expected_value = str(test_input)
+@pytest.mark.parametrize("cls,test_input,expected_value", basic_test_cases)
+def test_serialize_basic(mock_serializer, cls, test_input, expected_value):
+    """Test basic data type serialization to schema."""
     result = cls(mock_serializer).serialize(test_input)
 
     assert result == expected_value
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
 
 
-@pytest.mark.parametrize("cls,test_input", numeric_test_cases)
-def test_deserialize_numeric(mock_serializer, cls, test_input):
-    """Test deserialization to numeric."""
-    expected_value = test_input
-    result = cls(mock_serializer).deserialize(test_input)
+@pytest.mark.parametrize("cls,expected_value,test_value", basic_test_cases)
+def test_deserialize_basic(mock_serializer, cls, expected_value, test_value):
+    """Test deserialization to basic data types."""
+    result = cls(mock_serializer).deserialize(test_value)
 
     assert result == expected_value
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
+    assert type(result) is type(expected_value)
 
 
-@pytest.mark.parametrize("test_input", [True, False])
-def test_serialize_bool(mock_serializer, test_input):
-    """Test boolean serialization to schema."""
-    expected_value = test_input
-    result = BoolProcessor(mock_serializer).serialize(test_input)
+def test_serialize_extra_skipped(mock_serializer):
+    """Test `serialize_extra` is not called if it is not overridden."""
+    mock_serializer.mode = Mode.SAVE
+    processor = IntProcessor(mock_serializer)
+    with mock.patch.object(processor, "serialize_extra") as mock_serialize_extra:
+        schema = processor(42)
 
-    assert result == expected_value
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
+    assert schema == {TYPE_FIELD: "int", VALUE_FIELD: "42"}
+    mock_serialize_extra.assert_not_called()
 
 
-@pytest.mark.parametrize("test_input", [True, False])
-def test_deserialize_bool(mock_serializer, test_input):
-    """Test deserialization to boolean."""
-    expected_value = test_input
-    result = BoolProcessor(mock_serializer).deserialize(test_input)
+def test_schema_type_data_type_assigned_later(mock_serializer):
+    """Test `schema_type` follows a `data_type` assigned after class creation."""
 
-    assert result == expected_value
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
+    class LaterProcessor(StringProcessor):
+        pass
 
+    processor = LaterProcessor(mock_serializer)
+    assert processor.schema_type == "str"
 
-def test_serialize_null(mock_serializer):
-    """Test null serialization to schema."""
-    test_input = None
-    expected_value = test_input
-    result = NoneProcessor(mock_serializer).serialize(test_input)
+    LaterProcessor.data_type = int
+    assert processor.schema_type == "int"
+    assert StringProcessor(mock_serializer).schema_type == "str"
 
-    assert result == expected_value
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
 
+def test_serialize_extra_assigned_later(mock_serializer):
+    """Test `serialize_extra` assigned to the class after creation is called."""
+    mock_serializer.mode = Mode.SAVE
 
-def test_deserialize_null(mock_serializer):
-    """Test deserialization to None."""
-    test_value = None
-    result = NoneProcessor(mock_serializer).deserialize(test_value)
+    class LaterProcessor(IntProcessor):
+        pass
 
-    assert result is None
-    mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_not_called()
+    processor = LaterProcessor(mock_serializer)
+    assert processor(42) == {TYPE_FIELD: "int", VALUE_FIELD: "42"}
+
+    LaterProcessor.serialize_extra = lambda self, data: {"sign": data > 0}
+    assert processor(42) == {TYPE_FIELD: "int", VALUE_FIELD: "42", "sign": True}
@@ -4,15 +4,17 @@ import os
 from pathlib import PosixPath
 from typing import Callable
 
-import tensorflow as tf
+import pytest
 import torch
-from tf_hooks import register_forward_hook
-from torchvision.models.resnet import resnet50, ResNet50_Weights
+from torchvision.models.resnet import resnet50
 
 from safestructures import load_file, save_file
 
 os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
+# Round trip only every Nth module/layer (~5%) to limit disk writes per test.
+HOOK_STRIDE = 20
+
 
 class IOHook:
     """Base class for forward hook testing."""
@@ -60,9 +62,15 @@ class TorchIOHook(IOHook):
 class TFIOHook(IOHook):
     """TensorFlow test forward hook."""
 
-    is_equal_fn = tf.debugging.assert_near
     framework = "tf"
 
+    @staticmethod
+    def is_equal_fn(x, y):
+        """Check TensorFlow tensors for equality."""
+        import tensorflow as tf
+
+        tf.debugging.assert_near(x, y)
+
     def __call__(self, layer, args, kwargs, outputs):
         """Overload IOHook.__call__."""
         # No kwargs yet for these tests
@@ -70,30 +78,60 @@ class TFIOHook(IOHook):
         return
 
 
-def test_io_torch(tmp_path):
-    """Test PyTorch example."""
-    model = resnet50(weights=ResNet50_Weights.IMAGENET1K_V2)
+@pytest.fixture(scope="session")
+def torch_resnet50():
+    """Provide the PyTorch ResNet50 model, shared across tests."""
+    # Pretrained weights are not needed to test the save/load round trip.
+    model = resnet50(weights=None)
     model.eval()
+    return model
+
 
-    for n, m in model.named_modules():
+@pytest.fixture(scope="session")
+def tf_resnet50():
+    """Provide the Keras ResNet50 model, shared across tests."""
+    tf = pytest.importorskip("tensorflow")
+    # Pretrained weights are not needed to test the save/load round trip.
+    return tf.keras.applications.ResNet50(weights=None, input_shape=(32, 32, 3))
+
+
+@pytest.mark.slow
+def test_io_torch(tmp_path, torch_resnet50):
+    """Test PyTorch example."""
+    handles = []
+    for i, (n, m) in enumerate(torch_resnet50.named_modules()):
+        if i % HOOK_STRIDE:
+            continue
         layer_name = n if n else "model"
 
         io_hook = TorchIOHook(layer_name, tmp_path)
-        m.register_forward_hook(io_hook)
+        handles.append(m.register_forward_hook(io_hook))
 
-    test_input = torch.randn(8, 3, 224, 224)
+    test_input = torch.randn(1, 3, 64, 64)
 
-    with torch.no_grad():
-        model(test_input)
+    try:
+        with torch.no_grad():
+            torch_resnet50(test_input)
+    finally:
+        for handle in handles:
+            handle.remove()
 
 
-def test_io_tf(tmp_path):
+@pytest.mark.slow
+def test_io_tf(tmp_path, tf_resnet50):
     """Test TensorFlow example."""
-    model = tf.keras.applications.ResNet50(weights="imagenet")
+    tf = pytest.importorskip("tensorflow")
+    register_forward_hook = pytest.importorskip("tf_hooks").register_forward_hook
 
-    for layer in model.layers:
+    hooks = []
+    for layer in tf_resnet50.layers[::HOOK_STRIDE]:
         io_hook = TFIOHook(layer.name, tmp_path)
-        register_forward_hook(layer, io_hook)
+        hooks.append(register_forward_hook(layer, io_hook))
+
+    test_input = tf.random.uniform((1, 32, 32, 3), maxval=1)
 
-    test_input = tf.random.uniform((8, 224, 224, 3), maxval=1)
-    model(test_input)
+    try:
+        tf_resnet50(test_input)
+    finally:
+        for hook in hooks:
+            hook.remove()
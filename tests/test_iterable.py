@@ -1,11 +1,16 @@
 """Tests for the iterable datatype processors."""
-import ast
 from dataclasses import dataclass, fields, is_dataclass
 from unittest import mock
 
 import pytest
 
-from safestructures.constants import KEYS_FIELD, Mode, TYPE_FIELD, VALUE_FIELD
+from safestructures.constants import (
+    ITEM_TYPE_FIELD,
+    KEYS_FIELD,
+    Mode,
+    TYPE_FIELD,
+    VALUE_FIELD,
+)
 from safestructures.processors.iterable import (
     DataclassProcessor,
     DictProcessor,
@@ -15,25 +20,68 @@ from safestructures.processors.iterable import (
 )
 from safestructures.serializer import Serializer
 
+LISTLIKE_PROCESSORS = {
+    list: ListProcessor,
+    set: SetProcessor,
+    tuple: TupleProcessor,
+}
+
+LISTLIKE_SERIALIZED = [
+    {
+        TYPE_FIELD: "str",
+        VALUE_FIELD: "somebody",
+    },
+    {
+        TYPE_FIELD: "int",
+        VALUE_FIELD: "42",
+    },
+    {
+        TYPE_FIELD: "NoneType",
+        VALUE_FIELD: None,
+    },
+    {
+        TYPE_FIELD: "str",
+        VALUE_FIELD: "once told me",
+    },
+    {
+        TYPE_FIELD: "complex",
+        VALUE_FIELD: "(9001+3.14j)",
+    },
+    {
+        TYPE_FIELD: "float",
+        VALUE_FIELD: "1.618",
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def save_serializer():
+    """Provide Serializer in save mode, shared within the module."""
+    serializer = Serializer()
+    serializer.mode = Mode.SAVE
+    return serializer
+
+
+@pytest.fixture(scope="module")
+def load_serializer():
+    """Provide Serializer in load mode, shared within the module."""
+    serializer = Serializer()
+    serializer.mode = Mode.LOAD
+    return serializer
+
 
 @pytest.fixture
-def mock_serializer():
+def mock_serializer(mock_serializer, save_serializer):
     """Provide mocked Serializer fixture in save mode."""
-    mock_serializer = mock.MagicMock()
-    serializer = Serializer()
-    serializer.mode = Mode.SAVE
-    mock_serializer.serialize = mock.MagicMock(wraps=serializer.serialize)
+    mock_serializer.serialize = mock.Mock(wraps=save_serializer.serialize)
     return mock_serializer
 
 
 @pytest.fixture
-def mock_deserializer():
+def mock_deserializer(mock_deserializer, load_serializer):
     """Provide mocked Serializer fixture in load mode."""
-    mock_serializer = mock.MagicMock()
-    serializer = Serializer()
-    serializer.mode = Mode.LOAD
-    mock_serializer.deserialize = mock.MagicMock(wraps=serializer.deserialize)
-    return mock_serializer
+    mock_deserializer.deserialize = mock.Mock(wraps=load_serializer.deserialize)
+    return mock_deserializer
 
 
 def _serialize_listlike_test(mock_serializer, iterable_type, any_order=False):
@@ -42,61 +90,29 @@ def _serialize_listlike_test(mock_serializer, iterable_type, any_order=False):
         ["somebody", 42, None, "once told me", complex(9001, 3.14), 1.618]
     )
 
-    mock_calls = [mock.call(t) for t in test_input]
-    cls_map = {
-        list: ListProcessor,
-        set: SetProcessor,
-        tuple: TupleProcessor,
-    }
-    result = cls_map[iterable_type](mock_serializer).serialize(test_input)
+    result = LISTLIKE_PROCESSORS[iterable_type](mock_serializer).serialize(test_input)
+    called_with = [c.args[0] for c in mock_serializer.serialize.call_args_list]
 
     assert isinstance(result, list)
     assert len(result) == len(test_input)
-    mock_serializer.serialize.assert_has_calls(mock_calls, any_order=any_order)
+    if any_order:
+        assert len(called_with) == len(test_input)
+        assert set(called_with) == set(test_input)
+    else:
+        assert called_with == list(test_input)
     mock_serializer.deserialize.assert_not_called()
 
 
 def _deserialize_listlike_test(mock_serializer, iterable_type):
     """Test deserializing schemas for simple listlike objects."""
-    test_serialized = [
-        {
-            TYPE_FIELD: "str",
-            VALUE_FIELD: "somebody",
-        },
-        {
-            TYPE_FIELD: "int",
-            VALUE_FIELD: "42",
-        },
-        {
-            TYPE_FIELD: "NoneType",
-            VALUE_FIELD: None,
-        },
-        {
-            TYPE_FIELD: "str",
-            VALUE_FIELD: "once told me",
-        },
-        {
-            TYPE_FIELD: "complex",
-            VALUE_FIELD: "(9001+3.14j)",
-        },
-        {
-            TYPE_FIELD: "float",
-            VALUE_FIELD: "1.618",
-        },
-    ]
-    cls_map = {
-        list: ListProcessor,
-        set: SetProcessor,
-        tuple: TupleProcessor,
-    }
-
-    mock_calls = [mock.call(t) for t in test_serialized]
-    result = cls_map[iterable_type](mock_serializer).deserialize(test_serialized)
+    processor = LISTLIKE_PROCESSORS[iterable_type](mock_serializer)
+    result = processor.deserialize(LISTLIKE_SERIALIZED)
+    called_with = [c.args[0] for c in mock_serializer.deserialize.call_args_list]
 
     assert isinstance(result, iterable_type)
-    assert len(result) == len(test_serialized)
+    assert len(result) == len(LISTLIKE_SERIALIZED)
+    assert called_with == LISTLIKE_SERIALIZED
     mock_serializer.serialize.assert_not_called()
-    mock_serializer.deserialize.assert_has_calls(mock_calls, any_order=False)
 
 
 @pytest.mark.parametrize(
@@ -110,7 +126,66 @@ def test_serialize_listlike(mock_serializer, iterable_type, any_order):
 @pytest.mark.parametrize("iterable_type", [list, set, tuple])
 def test_deserialize_listlike(mock_deserializer, iterable_type):
     """Test deserialization to list."""
-    _deserialize_listlike_test(mock_deserializer, list)
+    _deserialize_listlike_test(mock_deserializer, iterable_type)
+
+
+@pytest.mark.parametrize(
+    "iterable_type,items,item_type",
+    [
+        (list, [1, 2, 3], "int"),
+        (tuple, (1.5, -2.25), "float"),
+        (set, {"anakin", "ahsoka"}, "str"),
+        (list, [True, False], "bool"),
+    ],
+)
+def test_listlike_homogeneous(
+    save_serializer, load_serializer, iterable_type, items, item_type
+):
+    """Test list-like data of one basic type is stored without item schemas."""
+    schema = LISTLIKE_PROCESSORS[iterable_type](save_serializer)(items)
+
+    assert schema[ITEM_TYPE_FIELD] == item_type
+    assert all(not isinstance(v, dict) for v in schema[VALUE_FIELD])
+
+    result = LISTLIKE_PROCESSORS[iterable_type](load_serializer)(schema)
+
+    assert isinstance(result, iterable_type)
+    assert result == items
+
+
+class _OwnSerializeListProcessor(ListProcessor):
+    def serialize(self, data: list) -> list:
+        return [self.serializer.serialize(d) for d in data]
+
+
+class _SuperSerializeListProcessor(ListProcessor):
+    def serialize(self, data: list) -> list:
+        return super().serialize(data)
+
+
+class _OwnDeserializeListProcessor(ListProcessor):
+    def deserialize(self, serialized: list, **kwargs) -> list:
+        return [self.serializer.deserialize(v) for v in serialized]
+
+
+@pytest.mark.parametrize(
+    "processor_cls",
+    [
+        _OwnSerializeListProcessor,
+        _SuperSerializeListProcessor,
+        _OwnDeserializeListProcessor,
+    ],
+)
+def test_listlike_homogeneous_overridden(
+    save_serializer, load_serializer, processor_cls
+):
+    """Test list-like data is not compacted if a subclass overrides processing."""
+    items = [1, 2, 3]
+    schema = processor_cls(save_serializer)(items)
+
+    assert ITEM_TYPE_FIELD not in schema
+    assert all(isinstance(v, dict) for v in schema[VALUE_FIELD])
+    assert processor_cls(load_serializer)(schema) == items
 
 
 def test_serialize_dict(mock_serializer):
@@ -122,20 +197,22 @@ def test_serialize_dict(mock_serializer):
         (1, 2): 3,
     }
 
-    mock_calls = [mock.call(v) for v in test_input.values()]
     result = DictProcessor(mock_serializer).serialize(test_input)
     extra_results = DictProcessor(mock_serializer).serialize_extra(test_input)
 
     assert isinstance(result, dict)
     assert len(result) == len(test_input)
-    assert len(extra_results[KEYS_FIELD]) == len(test_input)
+    # Only non-string keys need a key schema.
+    assert list(extra_results[KEYS_FIELD]) == ["(1, 2)"]
     for k in test_input:
         try:
             result[str(k)]
         except KeyError:
             raise KeyError(f"Key {k} not found in result's value field section.")
 
-    mock_serializer.serialize.assert_has_calls(mock_calls, any_order=True)
+    # Values are serialized in order, then the non-string key.
+    serialized = [c.args[0] for c in mock_serializer.serialize.call_args_list]
+    assert serialized == [*test_input.values(), (1, 2)]
     mock_serializer.deserialize.assert_not_called()
 
 
@@ -226,23 +303,43 @@ def test_deserialize_dict(mock_deserializer):
         },
     }
 
-    mock_calls = [mock.call(v) for v in serialized.values()]
-    for v in test_schema[KEYS_FIELD].values():
-        mock_calls.append(mock.call(v))
+    expected_calls = []
+    for k, v in serialized.items():
+        key_schema = test_schema[KEYS_FIELD][k]
+        # String keys are used as-is without deserialization.
+        if key_schema[TYPE_FIELD] != "str":
+            expected_calls.append(key_schema)
+        expected_calls.append(v)
     result = DictProcessor(mock_deserializer).deserialize(serialized, **kwargs)
+    called_with = [c.args[0] for c in mock_deserializer.deserialize.call_args_list]
 
-    assert isinstance(result, dict)
-    assert len(result) == len(serialized)
-    for k in serialized:
-        try:
-            if kwargs[KEYS_FIELD][k][TYPE_FIELD] == "tuple":
-                k = ast.literal_eval(k)
-            result[k]
-        except KeyError:
-            raise KeyError(f"Key {k} not found in deserialized result.")
+    # The tuple key is rebuilt from its key schema, not parsed from its string.
+    assert result == {
+        "name": "anakin",
+        "midichlorian_count": 27000,
+        "chosen_one": True,
+        (1, 2): 3,
+    }
 
     mock_deserializer.serialize.assert_not_called()
-    mock_deserializer.deserialize.assert_has_calls(mock_calls, any_order=True)
+    assert called_with == expected_calls
+
+
+def test_serialize_dict_string_keys(mock_serializer):
+    """Test dicts with only string keys have no key schema."""
+    test_input = {"name": "anakin", "chosen_one": True}
+    assert DictProcessor(mock_serializer).serialize_extra(test_input) == {}
+
+
+def test_deserialize_dict_string_keys(mock_deserializer):
+    """Test deserialization to dict without a key schema."""
+    serialized = {
+        "name": {TYPE_FIELD: "str", VALUE_FIELD: "anakin"},
+        "chosen_one": {TYPE_FIELD: "bool", VALUE_FIELD: True},
+    }
+    result = DictProcessor(mock_deserializer).deserialize(serialized)
+
+    assert result == {"name": "anakin", "chosen_one": True}
 
 
 def test_serialize_dataclass(mock_serializer):
@@ -260,7 +357,6 @@ def test_serialize_dataclass(mock_serializer):
         "midichlorian_count",
         "chosen_one",
     ]  # being explicit here instead of using dataclasses.fields
-    mock_calls = [mock.call(getattr(test_input, f)) for f in fields]
     result = DataclassProcessor(mock_serializer).serialize(test_input)
 
     assert isinstance(result, dict)
@@ -274,7 +370,8 @@ def test_serialize_dataclass(mock_serializer):
                 " not found in result's value field section."
             )
 
-    mock_serializer.serialize.assert_has_calls(mock_calls, any_order=True)
+    serialized = [c.args[0] for c in mock_serializer.serialize.call_args_list]
+    assert serialized == [getattr(test_input, f) for f in fields]
     mock_serializer.deserialize.assert_not_called()
 
 
@@ -295,8 +392,8 @@ def test_deserialize_dataclass(mock_deserializer):
         },
     }
 
-    mock_calls = [mock.call(v) for v in test_serialized.values()]
     result = DataclassProcessor(mock_deserializer).deserialize(test_serialized)
+    called_with = [c.args[0] for c in mock_deserializer.deserialize.call_args_list]
 
     assert is_dataclass(result)
     assert len(fields(result)) == len(test_serialized)
@@ -306,5 +403,18 @@ def test_deserialize_dataclass(mock_deserializer):
         except AttributeError:
             raise AttributeError(f"Field {f} not found in deserialized result.")
 
+    assert called_with == list(test_serialized.values())
     mock_deserializer.serialize.assert_not_called()
-    mock_deserializer.deserialize.assert_has_calls(mock_calls, any_order=False)
+
+
+def test_deserialize_dataclass_reused(mock_deserializer):
+    """Test deserialized dataclasses with the same fields share a class."""
+    test_serialized = {
+        "name": {TYPE_FIELD: "str", VALUE_FIELD: "anakin"},
+        "chosen_one": {TYPE_FIELD: "bool", VALUE_FIELD: True},
+    }
+    processor = DataclassProcessor(mock_deserializer)
+    result1 = processor.deserialize(test_serialized)
+    result2 = processor.deserialize(test_serialized)
+
+    assert type(result1) is type(result2)
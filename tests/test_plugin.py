@@ -1,5 +1,6 @@
 """Test plugin support."""
 
+import pytest
 import torch
 from transformers import BertConfig, BertModel
 from transformers.modeling_outputs import (
@@ -44,24 +45,38 @@ class BertEncoderOutputProcessor(ModelOutputProcessor):
     data_type = BaseModelOutputWithPastAndCrossAttentions
 
 
-def test_transformers_plugin(tmp_path):
-    """Test example plugins for transformer activations."""
-    config = BertConfig()
-    model = BertModel(config)
-    test_plugins = [BertOutputProcessor, BertEncoderOutputProcessor]
+@pytest.fixture(scope="session")
+def bert_model():
+    """Provide a randomly initialized BERT model, shared across tests."""
+    return BertModel(BertConfig()).eval()
 
+
+@pytest.fixture(scope="session")
+def bert_outputs(bert_model):
+    """Provide the BERT encoder and model outputs for a test input."""
     results = {}
 
     def _store_encoder_output(module, args, kwargs, output):
         results["encoder_output"] = output
         return output
 
-    model.encoder.register_forward_hook(_store_encoder_output, with_kwargs=True)
+    handle = bert_model.encoder.register_forward_hook(
+        _store_encoder_output, with_kwargs=True
+    )
+    try:
+        test_input_ids = torch.tensor([[0] * 128])
+        with torch.inference_mode():
+            results["model_output"] = bert_model(test_input_ids)
+    finally:
+        handle.remove()
 
-    test_input_ids = torch.tensor([[0] * 128])
-    test_output = model(test_input_ids)
+    return results
 
-    results["model_output"] = test_output
+
+def test_transformers_plugin(tmp_path, bert_outputs):
+    """Test example plugins for transformer activations."""
+    test_plugins = [BertOutputProcessor, BertEncoderOutputProcessor]
+    results = bert_outputs
 
     test_filepath = tmp_path / "test.safestructures"
     save_file(results, test_filepath, plugins=test_plugins)
@@ -74,5 +89,5 @@ def test_transformers_plugin(tmp_path):
         deserialized["model_output"], BaseModelOutputWithPoolingAndCrossAttentions
     )
 
-    compare_values(results["encoder_output"], deserialized["encoder_output"])
-    compare_values(results["model_output"], deserialized["model_output"])
+    assert compare_values(results["encoder_output"], deserialized["encoder_output"])
+    assert compare_values(results["model_output"], deserialized["model_output"])
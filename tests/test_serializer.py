@@ -1,17 +1,16 @@
 """Test `Serializer`."""
 
 import json
+import math
 from unittest import mock
 
-import jax
 import numpy as np
 import pytest
-import torch
 from safetensors import safe_open
 from safetensors.numpy import save_file
-from tensorflow.python.framework.ops import EagerTensor
 
 from safestructures.constants import (
+    ENCODER_FIELD,
     SCHEMA_FIELD,
     SCHEMA_VERSION,
     TYPE_FIELD,
@@ -19,42 +18,50 @@ from safestructures.constants import (
     VERSION_FIELD,
 )
 from safestructures.defaults import DEFAULT_PROCESS_MAP
-from safestructures.serializer import Serializer
+from safestructures.processors import tensor as tensor_processors
+from safestructures.serializer import _dump_schema, _load_schema, orjson, Serializer
 
-MOCK_DEFAULT_PROCESS_MAP = {
-    data_type: mock.MagicMock() for data_type in DEFAULT_PROCESS_MAP
-}
+MOCK_SCHEMA = {TYPE_FIELD: "mock_type", VALUE_FIELD: "mock_value"}
+MOCK_SCHEMA_JSON = json.dumps(MOCK_SCHEMA)
 
+# Module and name of the loaded tensor type, imported only by tests that need it.
 FRAMEWORK_TENSOR_TYPE_MAP = {
-    "np": np.ndarray,
-    "pt": torch.Tensor,
-    "tf": EagerTensor,
-    "jax": jax.Array,
+    "np": ("numpy", "ndarray"),
+    "pt": ("torch", "Tensor"),
+    "tf": ("tensorflow.python.framework.ops", "EagerTensor"),
+    "jax": ("jax", "Array"),
 }
 
+LOAD_TENSOR_ID = "test_tensor_id"
+
+
+@pytest.fixture(scope="module")
+def load_test_file(tmp_path_factory):
+    """Provide a safetensors file to load, written once for the module."""
+    file_path = tmp_path_factory.mktemp("load") / "test.safetensors"
+    save_file(
+        {LOAD_TENSOR_ID: np.array([1, 2, 3, 4])},
+        file_path,
+        metadata={SCHEMA_FIELD: MOCK_SCHEMA_JSON},
+    )
+    return file_path
+
 
 class TestSerializer:
     """`Serializer` test cases."""
 
     def setup_method(self, method):
         """Set up before each test method."""
+        # Plain mocks suffice since only calls are checked; these are rebuilt
+        # for every test, so no reset is needed.
         self.mock_processor_instances = {
-            data_type: mock.MagicMock() for data_type in DEFAULT_PROCESS_MAP
+            data_type: mock.Mock() for data_type in DEFAULT_PROCESS_MAP
         }
         self.mock_default_process_map = {
-            data_type: mock.MagicMock(
-                return_value=self.mock_processor_instances[data_type]
-            )
+            data_type: mock.Mock(return_value=self.mock_processor_instances[data_type])
             for data_type in DEFAULT_PROCESS_MAP
         }
 
-    def teardown_method(self, method):
-        """Tear down after each test method."""
-        for v in self.mock_default_process_map.values():
-            v.reset_mock()
-        for v in self.mock_processor_instances.values():
-            v.reset_mock()
-
     @pytest.mark.parametrize("data_type", DEFAULT_PROCESS_MAP.keys())
     def test_serialize(self, data_type):
         """Test `Serializer.serialize`."""
@@ -98,17 +105,101 @@ class TestSerializer:
             )
             mock_serialize.assert_not_called()
 
+    def test_processor_reused(self):
+        """Test processor instances are created once per data type."""
+        serializer = Serializer()
+        with mock.patch.object(
+            serializer, "process_map", self.mock_default_process_map
+        ):
+            serializer.serialize(1)
+            serializer.serialize(2)
+            serializer.deserialize({TYPE_FIELD: "int"})
+
+            self.mock_default_process_map[int].assert_called_once_with(serializer)
+            assert self.mock_processor_instances[int].call_count == 3
+
+    @pytest.mark.parametrize("orjson_module", [orjson, None])
+    def test_dump_load_schema(self, orjson_module):
+        """Test the schema round trips with and without `orjson`."""
+        schema = {TYPE_FIELD: "dict", VALUE_FIELD: {"a": {TYPE_FIELD: "int"}}}
+        with mock.patch("safestructures.serializer.orjson", orjson_module):
+            schema_str, encoder = _dump_schema(schema)
+            assert json.loads(schema_str) == schema
+            assert _load_schema(schema_str, encoder=encoder) == schema
+
+    @pytest.mark.parametrize("orjson_module", [orjson, None])
+    @pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+    def test_dump_load_schema_non_finite(self, orjson_module, value):
+        """Test non-finite floats round trip the same with and without `orjson`."""
+        schema = {TYPE_FIELD: "mock_type", VALUE_FIELD: [None, value]}
+        with mock.patch("safestructures.serializer.orjson", orjson_module):
+            schema_str, encoder = _dump_schema(schema)
+            assert schema_str == json.dumps(schema)
+            loaded = _load_schema(schema_str, encoder=encoder)
+
+        assert loaded[VALUE_FIELD][0] is None
+        loaded_value = loaded[VALUE_FIELD][1]
+        if math.isnan(value):
+            assert math.isnan(loaded_value)
+        else:
+            assert loaded_value == value
+
+    @pytest.mark.parametrize("orjson_module", [orjson, None])
+    @pytest.mark.parametrize("value", [2**70, -(2**70)])
+    def test_dump_load_schema_big_int(self, orjson_module, value):
+        """Test integers wider than 64 bits round trip exactly."""
+        schema = {TYPE_FIELD: "mock_type", VALUE_FIELD: [1, value]}
+        with mock.patch("safestructures.serializer.orjson", orjson_module):
+            schema_str, encoder = _dump_schema(schema)
+            assert schema_str == json.dumps(schema)
+            loaded = _load_schema(schema_str, encoder=encoder)
+
+        assert loaded == schema
+        assert type(loaded[VALUE_FIELD][1]) is int
+
+    def test_load_schema_unknown_encoder(self):
+        """Test schemas without a known encoder are read exactly."""
+        schema = {TYPE_FIELD: "mock_type", VALUE_FIELD: 2**70}
+        assert _load_schema(json.dumps(schema)) == schema
+
+    def test_get_data_type_cached(self):
+        """Test resolved data types are cached by their type string."""
+        type_str = "pathlib.PurePosixPath"
+        with mock.patch.object(
+            Serializer, "_resolve_data_type", wraps=Serializer._resolve_data_type
+        ) as mock_resolve:
+            data_type = Serializer._get_data_type(type_str)
+            assert Serializer._get_data_type(type_str) is data_type
+            mock_resolve.assert_called_once_with(type_str)
+
+    @pytest.mark.parametrize(
+        "processor_name,module_name",
+        [
+            ("TorchProcessor", "torch"),
+            ("TFProcessor", "tensorflow"),
+            ("JaxProcessor", "jax"),
+        ],
+    )
+    def test_lazy_processor(self, processor_name, module_name):
+        """Test ML framework processors are registered once needed."""
+        pytest.importorskip(module_name)
+        processor_cls = getattr(tensor_processors, processor_name)
+        serializer = Serializer()
+        assert processor_cls.data_type not in serializer.process_map
+
+        serializer._register_lazy_processor(processor_cls.data_type)
+        assert serializer.process_map[processor_cls.data_type] is processor_cls
+
     def test_save_with_tensor(self, tmp_path):
         """Test `Serializer.save` with tensors."""
-        mock_schema = {TYPE_FIELD: "mock_type", VALUE_FIELD: "mock_value"}
-        test_tensor = np.random.rand(4, 3, 224, 224)
+        test_tensor = np.arange(48, dtype=np.float32).reshape(4, 3, 2, 2)
         test_tensor_id = "mock_tensor_id"
         mock_data = mock.Mock()
         test_other_metadata = {"other_field": "other_value"}
 
         def mock_serialize_with_tensor(self, data):
             self.tensors[test_tensor_id] = test_tensor
-            return mock_schema
+            return MOCK_SCHEMA
 
         file_name_with_tensor = "test_with_tensor.safestructures"
 
@@ -121,6 +212,7 @@ class TestSerializer:
             serializer.save(
                 mock_data, temp_with_tensor_path, metadata=test_other_metadata
             )
+            assert not serializer.tensors
 
         with safe_open(temp_with_tensor_path, framework="np") as f:
             tensors = {}
@@ -132,17 +224,17 @@ class TestSerializer:
         np.testing.assert_allclose(tensors[test_tensor_id], test_tensor)
 
         assert metadata["other_field"] == "other_value"
-        assert metadata[SCHEMA_FIELD] == json.dumps(mock_schema)
+        assert json.loads(metadata[SCHEMA_FIELD]) == MOCK_SCHEMA
         assert metadata[VERSION_FIELD] == SCHEMA_VERSION
+        assert metadata[ENCODER_FIELD] in ("orjson", "json")
 
     def test_save_no_tensor(self, tmp_path):
         """Test `Serializer.save` without tensors."""
-        mock_schema = {TYPE_FIELD: "mock_type", VALUE_FIELD: "mock_value"}
         mock_data = mock.Mock()
         test_other_metadata = {"other_field": "other_value"}
 
         def mock_serialize_no_tensor(self, data):
-            return mock_schema
+            return MOCK_SCHEMA
 
         file_name_no_tensor = "test_no_tensor.safestructures"
 
@@ -166,27 +258,21 @@ class TestSerializer:
         np.testing.assert_allclose(tensors["null"], np.array([0]))
 
         assert metadata["other_field"] == "other_value"
-        assert metadata[SCHEMA_FIELD] == json.dumps(mock_schema)
+        assert json.loads(metadata[SCHEMA_FIELD]) == MOCK_SCHEMA
         assert metadata[VERSION_FIELD] == SCHEMA_VERSION
+        assert metadata[ENCODER_FIELD] in ("orjson", "json")
 
     @pytest.mark.parametrize("framework", FRAMEWORK_TENSOR_TYPE_MAP.keys())
-    def test_load(self, tmp_path, framework):
+    def test_load(self, load_test_file, framework):
         """Test `Serialize.load`."""
-        mock_schema = {TYPE_FIELD: "mock_type", VALUE_FIELD: "mock_value"}
-        test_metadata = {SCHEMA_FIELD: json.dumps(mock_schema)}
-
-        temp_file_path = tmp_path / "test.safetensors"
-        tensor_id = "test_tensor_id"
-        mock_tensor_dict = {tensor_id: np.array([1, 2, 3, 4])}
-        save_file(mock_tensor_dict, temp_file_path, metadata=test_metadata)
+        module_name, type_name = FRAMEWORK_TENSOR_TYPE_MAP[framework]
+        tensor_type = getattr(pytest.importorskip(module_name), type_name)
 
         serializer = Serializer()
         mock_results = mock.Mock()
         mock_deserializer = mock.MagicMock(return_value=mock_results)
         with mock.patch.object(serializer, "deserialize", mock_deserializer):
-            results = serializer.load(temp_file_path, framework=framework)
-            mock_deserializer.assert_called_once_with(mock_schema)
+            results = serializer.load(load_test_file, framework=framework)
+            mock_deserializer.assert_called_once_with(MOCK_SCHEMA)
             assert results == mock_results
-            assert isinstance(
-                serializer.tensors[tensor_id], FRAMEWORK_TENSOR_TYPE_MAP[framework]
-            )
+            assert isinstance(serializer.tensors[LOAD_TENSOR_ID], tensor_type)
@@ -1,5 +1,6 @@
 """Tests for the basic datatype processors."""
 
+import zlib
 from typing import Callable
 from unittest import mock
 
@@ -30,61 +31,74 @@ def mock_serializer():
         Serializer(), "tensors"
     ), "Test expects Serializer.tensors to exist, and this is no longer valid."
     mock_serializer.tensors = {}
+    assert hasattr(
+        Serializer(), "tensor_memo"
+    ), "Test expects Serializer.tensor_memo to exist, and this is no longer valid."
+    mock_serializer.tensor_memo = {}
     return mock_serializer
 
 
 MAX_DIM = 8
 MAX_DIM_SIZE = 4
+N_TENSORS = 10
+
+
+@pytest.fixture
+def rng(request):
+    """Provide a random generator seeded by the test name.
+
+    Each test draws its own tensor shapes, regardless of which tests run
+    or in what order.
+    """
+    return np.random.default_rng(zlib.crc32(request.node.name.encode()))
 
 
-def _generate_dims():
+def _generate_dims(rng: np.random.Generator):
     """Generate random dimensions for test tensors."""
-    return np.random.randint(1, MAX_DIM, size=np.random.randint(1, MAX_DIM_SIZE))
+    ndim = rng.integers(1, MAX_DIM_SIZE)
+    return tuple(int(d) for d in rng.integers(1, MAX_DIM, size=ndim))
 
 
-def _random_tensor_numpy():
+def _random_tensor_numpy(rng: np.random.Generator):
     """Generate a random numpy tensor."""
-    dims = _generate_dims()
-    return np.random.rand(*dims)
+    dims = _generate_dims(rng)
+    return rng.random(dims)
 
 
-def _random_tensor_torch():
+def _random_tensor_torch(rng: np.random.Generator):
     """Generate a random torch tensor."""
-    dims = _generate_dims()
+    dims = _generate_dims(rng)
     return torch.randn(*dims)
 
 
 def _check_torch_tensors(test_tensor: np.ndarray, expected_tensor: torch.Tensor):
     """Check that the test numpy tensor and expected torch tensor are equal."""
-    torch.testing.assert_close(torch.from_numpy(test_tensor), expected_tensor)
+    np.testing.assert_array_equal(test_tensor, expected_tensor.numpy())
 
 
-def _random_tensor_tf():
+def _random_tensor_tf(rng: np.random.Generator):
     """Generate a random numpy tensor."""
-    dims = _generate_dims()
+    dims = _generate_dims(rng)
     return tf.random.uniform(shape=dims)
 
 
 def _check_tf_tensors(test_tensor: np.ndarray, expected_tensor: tf.Tensor):
-    assert tf.math.reduce_all(
-        tf.equal(tf.convert_to_tensor(test_tensor), expected_tensor)
-    ), "Tensors are not equal"
+    np.testing.assert_array_equal(test_tensor, expected_tensor.numpy())
 
 
-def _random_tensor_jax():
+def _random_tensor_jax(rng: np.random.Generator):
     """Generate a random numpy tensor."""
-    key = jax.random.PRNGKey(42)
-    dims = _generate_dims()
+    dims = _generate_dims(rng)
+    key = jax.random.PRNGKey(rng.integers(2**31))
     return jax.random.uniform(key, shape=dims)
 
 
 def _check_jax_tensors(test_tensor: np.ndarray, expected_tensor: jax.Array):
-    assert jnp.array_equal(jnp.array(test_tensor), expected_tensor)
+    np.testing.assert_array_equal(test_tensor, np.asarray(expected_tensor))
 
 
-N_TENSORS = 10
 serialize_test_cases = [
-    (NumpyProcessor, _random_tensor_numpy, np.testing.assert_equal),
+    (NumpyProcessor, _random_tensor_numpy, np.testing.assert_array_equal),
     (TorchProcessor, _random_tensor_torch, _check_torch_tensors),
     (TFProcessor, _random_tensor_tf, _check_tf_tensors),
     (JaxProcessor, _random_tensor_jax, _check_jax_tensors),
@@ -96,6 +110,7 @@ serialize_test_cases = [
 )
 def test_serialize_tensor(
     mock_serializer,
+    rng: np.random.Generator,
     processor_cls: TensorProcessor,
     random_tensor_fn: Callable,
     is_equal_fn: Callable,
@@ -115,7 +130,7 @@ def test_serialize_tensor(
             mock_to_numpy.reset_mock()
             mock_process_tensor.reset_mock()
 
-            test_input = random_tensor_fn()
+            test_input = random_tensor_fn(rng)
             test_tensors.append(test_input)
 
             processor.serialize(test_input)
@@ -131,18 +146,88 @@ def test_serialize_tensor(
         is_equal_fn(mock_serializer.tensors[_expected_id], test_tensors[i])
 
 
+@pytest.fixture(scope="module")
+def stored_tensors():
+    """Provide loaded numpy tensors by ID, shared since they are only read."""
+    rng = np.random.default_rng(0)
+    return {str(i): _random_tensor_numpy(rng) for i in range(N_TENSORS)}
+
+
 @pytest.mark.parametrize("processor_cls", PROCESSOR_CLS_LIST)
-def test_deserialize_tensor(mock_serializer, processor_cls: TensorProcessor):
+def test_deserialize_tensor(
+    mock_serializer, stored_tensors, processor_cls: TensorProcessor
+):
     """Test tensor processor deserialization."""
-    test_tensors = []
-    for i in range(N_TENSORS):
-        input_tensor = _random_tensor_numpy()
-        mock_serializer.tensors[str(i)] = input_tensor
-        test_tensors.append(input_tensor)
+    mock_serializer.tensors = stored_tensors
 
     processor = processor_cls(mock_serializer)
-    for i in range(N_TENSORS):
-        np.testing.assert_equal(processor.deserialize(str(i)), test_tensors[i])
+    for tensor_id, test_tensor in stored_tensors.items():
+        np.testing.assert_array_equal(processor.deserialize(tensor_id), test_tensor)
 
     mock_serializer.serialize.assert_not_called()
     mock_serializer.deserialize.assert_not_called()
+
+
+def test_serialize_non_contiguous_tensor(mock_serializer):
+    """Test non-contiguous arrays are stored contiguously."""
+    test_input = np.random.rand(3, 4).T
+    assert not test_input.flags.c_contiguous
+
+    processor = NumpyProcessor(mock_serializer)
+    tensor_id = processor.serialize(test_input)
+
+    assert mock_serializer.tensors[tensor_id].flags.c_contiguous
+    np.testing.assert_array_equal(mock_serializer.tensors[tensor_id], test_input)
+
+
+float_dtype_test_cases = [
+    (TorchProcessor, lambda: torch.ones(2, 3, dtype=torch.float16), np.float16),
+    (TorchProcessor, lambda: torch.ones(2, 3, dtype=torch.bfloat16), np.float32),
+    (TFProcessor, lambda: tf.ones((2, 3), dtype=tf.float16), np.float16),
+    (TFProcessor, lambda: tf.ones((2, 3), dtype=tf.bfloat16), np.float32),
+    (JaxProcessor, lambda: jnp.ones((2, 3), dtype=jnp.float16), np.float16),
+    (JaxProcessor, lambda: jnp.ones((2, 3), dtype=jnp.bfloat16), np.float32),
+]
+
+
+@pytest.mark.parametrize(
+    "processor_cls,tensor_fn,expected_dtype", float_dtype_test_cases
+)
+def test_to_numpy_float_dtype(
+    mock_serializer,
+    processor_cls: TensorProcessor,
+    tensor_fn: Callable,
+    expected_dtype: np.dtype,
+):
+    """Test float tensors are only cast to FP32 if NumPy does not support them."""
+    result = processor_cls(mock_serializer).to_numpy(tensor_fn())
+    assert result.dtype == expected_dtype
+
+
+def test_torch_to_numpy_shares_memory(mock_serializer):
+    """Test contiguous CPU torch tensors are converted without a copy."""
+    test_input = torch.randn(2, 3)
+    result = TorchProcessor(mock_serializer).to_numpy(test_input)
+    assert np.shares_memory(result, test_input.numpy())
+
+
+@pytest.mark.parametrize(
+    "processor_cls,random_tensor_fn,is_equal_fn", serialize_test_cases
+)
+def test_serialize_shared_tensor(
+    mock_serializer,
+    rng: np.random.Generator,
+    processor_cls: TensorProcessor,
+    random_tensor_fn: Callable,
+    is_equal_fn: Callable,
+):
+    """Test a tensor referenced multiple times is only stored once."""
+    processor = processor_cls(mock_serializer)
+    test_input = random_tensor_fn(rng)
+
+    tensor_id = processor.serialize(test_input)
+    assert processor.serialize(test_input) == tensor_id
+    assert processor.serialize(random_tensor_fn(rng)) != tensor_id
+
+    assert len(mock_serializer.tensors) == 2
+    is_equal_fn(mock_serializer.tensors[tensor_id], test_input)
@@ -1,6 +1,8 @@
 """Test the wrapper functions."""
 from unittest import mock
 
+import pytest
+
 from safestructures import DataProcessor, load_file, save_file
 
 
@@ -18,40 +20,41 @@ class MockPlugin(DataProcessor):
         pass
 
 
-def test_save_file():
+@pytest.fixture
+def patched_serializer():
+    """Patch `Serializer` in the wrapper module, providing the mocked class."""
+    mock_serializer_instance = mock.Mock()
+    mock_serializer = mock.Mock(return_value=mock_serializer_instance)
+    with mock.patch("safestructures.wrapper.Serializer", mock_serializer):
+        yield mock_serializer
+
+
+def test_save_file(patched_serializer):
     """Test the `save_file` wrapper function."""
     mock_input = mock.Mock()
     mock_save_path = "path/to/save.safetensors"
     mock_metadata = {"mock_field": "mock_value"}
-    mock_serializer_instance = mock.MagicMock()
-    mock_serializer = mock.MagicMock(return_value=mock_serializer_instance)
 
-    with mock.patch("safestructures.wrapper.Serializer", mock_serializer):
-        save_file(
-            mock_input, mock_save_path, metadata=mock_metadata, plugins=MockPlugin
-        )
-        mock_serializer.assert_called_once_with(plugins=[MockPlugin])
-        mock_serializer_instance.save.assert_called_once_with(
-            mock_input, mock_save_path, metadata=mock_metadata
-        )
+    save_file(mock_input, mock_save_path, metadata=mock_metadata, plugins=MockPlugin)
+    patched_serializer.assert_called_once_with(plugins=[MockPlugin])
+    patched_serializer.return_value.save.assert_called_once_with(
+        mock_input, mock_save_path, metadata=mock_metadata
+    )
 
 
-def test_load_file():
+def test_load_file(patched_serializer):
     """Test the `load_file` wrapper function."""
     mock_load_path = "path/to/save.safetensors"
     mock_framework = "mock_framework"
     mock_device = "mock_device"
-    mock_serializer_instance = mock.MagicMock()
-    mock_serializer = mock.MagicMock(return_value=mock_serializer_instance)
 
-    with mock.patch("safestructures.wrapper.Serializer", mock_serializer):
-        load_file(
-            mock_load_path,
-            framework=mock_framework,
-            device=mock_device,
-            plugins=MockPlugin,
-        )
-        mock_serializer.assert_called_once_with(plugins=[MockPlugin])
-        mock_serializer_instance.load.assert_called_once_with(
-            mock_load_path, framework=mock_framework, device=mock_device
-        )
+    load_file(
+        mock_load_path,
+        framework=mock_framework,
+        device=mock_device,
+        plugins=MockPlugin,
+    )
+    patched_serializer.assert_called_once_with(plugins=[MockPlugin])
+    patched_serializer.return_value.load.assert_called_once_with(
+        mock_load_path, framework=mock_framework, device=mock_device
+    )
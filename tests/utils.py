@@ -1,18 +1,22 @@
 """Testing utilities."""
 
-from copy import deepcopy
 from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from typing import Union
 
 import jax
-import jax.numpy as jnp
 import numpy as np
 import tensorflow as tf
 import torch
 from jaxlib.xla_extension import ArrayImpl
 from tensorflow.python.framework.ops import EagerTensor
 
-from safestructures.constants import KEYS_FIELD, TYPE_FIELD, VALUE_FIELD
+from safestructures.constants import (
+    ITEM_TYPE_FIELD,
+    KEYS_FIELD,
+    TYPE_FIELD,
+    VALUE_FIELD,
+)
 from safestructures.utils.dataclass import SafestructuresDataclass
 
 
@@ -26,18 +30,15 @@ def check_schema(
         expected_type (str): The expected string that denotes the type in the schema.
         expected_value (Union[str, None, bool]): The expected value in the schema.
     """
-    error_msg = f"{schema} is not dict"
-    assert isinstance(schema, dict), error_msg
+    assert isinstance(schema, dict), f"{schema} is not dict"
 
-    for f in [TYPE_FIELD, VALUE_FIELD]:
-        error_msg = f"Missing key {f} in schema."
-        assert f in schema, error_msg
+    missing = {TYPE_FIELD, VALUE_FIELD} - schema.keys()
+    assert not missing, f"Missing keys {missing} in schema."
 
-    error_msg = (
-        "Schema type check failed",
-        f"Expected {expected_type}, got {schema[TYPE_FIELD]}",
+    assert schema[TYPE_FIELD] == expected_type, (
+        "Schema type check failed. "
+        f"Expected {expected_type}, got {schema[TYPE_FIELD]}"
     )
-    assert schema[TYPE_FIELD] == expected_type, error_msg
     assert schema[VALUE_FIELD] == expected_value, "Schema value check failed."
 
 
@@ -54,8 +55,12 @@ def generate_schema(type_value: str, value: Union[str, None, bool]) -> dict:
     return {TYPE_FIELD: type_value, VALUE_FIELD: value}
 
 
+_ORDERED_TYPES = frozenset({"list", "tuple"})
+_MAPPING_TYPES = frozenset({"dict", SafestructuresDataclass.__name__})
+
+
 def compare_nested_schemas(schema1: dict, schema2: dict):
-    """Recursively compare two schemas.
+    """Compare two nested schemas, stopping at the first mismatch.
 
     If TYPE_FIELD is 'set', the order of elements in VALUE_FIELD (as strings)
         does not matter.
@@ -65,135 +70,140 @@ def compare_nested_schemas(schema1: dict, schema2: dict):
         schema1 (dict): Schema to compare.
         schema2 (dict): Other schema to compare.
     """
+    stack = [(schema1, schema2)]
+    while stack:
+        schema1, schema2 = stack.pop()
+        if schema1.keys() != schema2.keys():
+            return False
 
-    def compare_serialized_values(value1, value2, value_type: str):
-        """Compare values based on their type."""
-        if value_type == "set":
-            # Compare sets (order does not matter)
-            # TODO: Account for sets with tuple items.
-            return set(map(tuple, value1)) == set(map(tuple, value2))
-        elif value_type in {"list", "tuple"}:
-            # Compare lists/tuples (order matters)
-            return len(value1) == len(value2) and all(
-                compare_nested_schemas(item1, item2)
-                for item1, item2 in zip(value1, value2)
-            )
-        elif value_type in {"dict", SafestructuresDataclass.__name__}:
-            return all(
-                compare_nested_schemas(value1[key], value2[key]) for key in value1
-            )
-        else:
-            # For primitive types, compare values as strings
-            return str(value1) == str(value2)
-
-    if set(schema1.keys()) != set(schema2.keys()):
-        return False
+        if TYPE_FIELD not in schema1:
+            # Schemas by name, such as dict values and keys.
+            stack.extend((schema1[k], schema2[k]) for k in schema1)
+            continue
 
-    if TYPE_FIELD in schema1:
-        if schema1[TYPE_FIELD] != schema2[TYPE_FIELD]:
+        value_type = schema1[TYPE_FIELD]
+        if value_type != schema2[TYPE_FIELD]:
             return False
 
-        if schema1[TYPE_FIELD] == "dict":
-            if not compare_nested_schemas(schema1[KEYS_FIELD], schema2[KEYS_FIELD]):
+        if value_type == "dict" and KEYS_FIELD in schema1:
+            stack.append((schema1[KEYS_FIELD], schema2[KEYS_FIELD]))
+
+        if VALUE_FIELD not in schema1:
+            continue
+
+        value1, value2 = schema1[VALUE_FIELD], schema2[VALUE_FIELD]
+        if ITEM_TYPE_FIELD in schema1:
+            # Items of list-like data are stored as serialized values only.
+            if schema1[ITEM_TYPE_FIELD] != schema2[ITEM_TYPE_FIELD]:
+                return False
+            if value_type == "set":
+                if set(value1) != set(value2):
+                    return False
+            elif value1 != value2:
                 return False
 
-    # Compare the VALUE_FIELD fields
-    if VALUE_FIELD in schema1:
-        if not compare_serialized_values(
-            schema1[VALUE_FIELD], schema2[VALUE_FIELD], schema1[TYPE_FIELD]
-        ):
-            return False
-    else:
-        for k in schema1:
-            if not compare_nested_schemas(schema1[k], schema2[k]):
+        elif value_type == "set":
+            # Compare sets (order does not matter)
+            # TODO: Account for sets with tuple items.
+            if set(map(tuple, value1)) != set(map(tuple, value2)):
                 return False
 
+        elif value_type in _ORDERED_TYPES:
+            # Compare lists/tuples (order matters)
+            if len(value1) != len(value2):
+                return False
+            stack.extend(zip(value1, value2))
+
+        elif value_type in _MAPPING_TYPES:
+            stack.extend((value1[key], value2[key]) for key in value1)
+
+        elif str(value1) != str(value2):
+            # For primitive types, compare values as strings
+            return False
+
     return True
 
 
 def _assert_tf_equal(tensor1, tensor2):
-    assert tf.math.reduce_all(tf.equal(tensor1, tensor2))
+    np.testing.assert_array_equal(tensor1.numpy(), tensor2.numpy())
 
 
-NP2F_MAP = {
-    np.ndarray: lambda x: x,
-    torch.Tensor: torch.from_numpy,
-    tf.Tensor: tf.convert_to_tensor,
-    EagerTensor: tf.convert_to_tensor,
-    jax.Array: jnp.array,
-    ArrayImpl: jnp.array,
-}
+def _assert_jax_equal(array1, array2):
+    np.testing.assert_array_equal(np.asarray(array1), np.asarray(array2))
 
-F2NP_MAP = {
-    np.ndarray: lambda x: x,
-    torch.Tensor: lambda x: x.numpy(),
-    tf.Tensor: lambda x: x.numpy(),
-    EagerTensor: lambda x: x.numpy(),
-    jax.Array: lambda x: np.asarray(x),
-    ArrayImpl: lambda x: np.asarray(x),
-}
 
-ASSERT_EQUAL_MAP = {
-    np.ndarray: np.testing.assert_equal,
-    torch.Tensor: torch.testing.assert_close,
-    tf.Tensor: _assert_tf_equal,
-    EagerTensor: _assert_tf_equal,
-    jax.Array: jnp.array_equal,
-    ArrayImpl: jnp.array_equal,
+# Conversion to numpy and equality assertion, by tensor type.
+FRAMEWORK_HANDLERS = {
+    np.ndarray: (lambda x: x, np.testing.assert_array_equal),
+    torch.Tensor: (lambda x: x.numpy(), torch.testing.assert_close),
+    tf.Tensor: (lambda x: x.numpy(), _assert_tf_equal),
+    EagerTensor: (lambda x: x.numpy(), _assert_tf_equal),
+    jax.Array: (np.asarray, _assert_jax_equal),
+    ArrayImpl: (np.asarray, _assert_jax_equal),
 }
 
-FRAMEWORK_TENSORS = tuple(NP2F_MAP.keys())
+FRAMEWORK_TENSORS = tuple(FRAMEWORK_HANDLERS.keys())
+
+
+@lru_cache(maxsize=None)
+def _field_names(dataclass_type: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(dataclass_type))
 
 
 def compare_values(value1, value2):
-    """Recursively compare two values."""
+    """Compare two nested values, stopping at the first mismatch."""
+    stack = [(value1, value2)]
+    while stack:
+        value1, value2 = stack.pop()
+        if value1 is value2:
+            continue
 
-    def _helper(value1, value2):
         if is_dataclass(value1):
             if not is_dataclass(value2):
                 return False
 
-            fields1 = [f.name for f in fields(value1)]
-            fields2 = [f.name for f in fields(value2)]
-            if set(fields1) != set(fields2):
+            fields1 = _field_names(type(value1))
+            if set(fields1) != set(_field_names(type(value2))):
                 return False
 
-            for f in fields1:
-                if not compare_values(getattr(value1, f), getattr(value2, f)):
-                    return False
+            stack.extend((getattr(value1, f), getattr(value2, f)) for f in fields1)
 
-        else:
-            if type(value1) is not type(value2):
+        elif isinstance(value1, FRAMEWORK_TENSORS):
+            # Tensors may be loaded as another framework's type.
+            if not isinstance(value2, FRAMEWORK_TENSORS):
                 return False
 
-            if isinstance(value1, (list, tuple)):
-                for v1, v2 in zip(value1, value2):
-                    if not compare_values(v1, v2):
-                        return False
-
-            elif isinstance(value1, dict):
-                if not set(value1.keys()) == set(value2.keys()):
-                    return False
+            tensor_type = type(value1)
+            to_numpy, assert_equal = FRAMEWORK_HANDLERS[tensor_type]
+            if isinstance(value2, tensor_type):
+                assert_equal(value1, value2)
+            else:
+                # Compare as numpy; another framework may load at lower precision,
+                # e.g. JAX defaults to float32.
+                np.testing.assert_allclose(
+                    FRAMEWORK_HANDLERS[type(value2)][0](value2),
+                    to_numpy(value1),
+                    rtol=1e-6,
+                )
+
+        elif type(value1) is not type(value2):
+            return False
 
-                for k in value1:
-                    if not compare_values(value1[k], value2[k]):
-                        return False
+        elif isinstance(value1, (list, tuple)):
+            if len(value1) != len(value2):
+                return False
 
-            elif isinstance(value1, FRAMEWORK_TENSORS):
-                tensor_type = type(value1)
-                test_value2 = deepcopy(value2)
-                if not isinstance(test_value2, tensor_type):
-                    # convert to numpy, then to framework for generality
-                    test_value2 = F2NP_MAP[type(test_value2)](test_value2)
-                    test_value2 = NP2F_MAP[tensor_type](test_value2)
+            stack.extend(zip(value1, value2))
 
-                ASSERT_EQUAL_MAP[tensor_type](value1, test_value2)
+        elif isinstance(value1, dict):
+            if not set(value1.keys()) == set(value2.keys()):
+                return False
 
-            else:
-                # TODO: Handle set containing tuples
-                if not value1 == value2:
-                    return False
+            stack.extend((value1[k], value2[k]) for k in value1)
 
-        return True
+        else:
+            # TODO: Handle set containing tuples
+            if not value1 == value2:
+                return False
 
-    return _helper(value1, value2)
+    return True